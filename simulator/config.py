@@ -5,7 +5,18 @@ Arazi Yönetim Sistemi - Konfigürasyon
 """
 
 import os
-from typing import Dict, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Any, NamedTuple
+
+class SensorRange(NamedTuple):
+    """Sensör tipi için değer aralığı"""
+    min: float
+    max: float
+    critical_min: float
+    critical_max: float
+    unit: str
+    variation: float
 
 class DatabaseConfig:
     """Veritabanı konfigürasyonu"""
@@ -22,13 +33,38 @@ class DatabaseConfig:
     COLLATION = 'utf8mb4_unicode_ci'
     
     # Pool ayarları
-    POOL_SIZE = 5
+    # Havuz boyutu eşzamanlı iş sayısına göre seçilmeli; kaba kural NCPU ile
+    # NCPU + NCPU/2 arası. mysql.connector en fazla 32 bağlantıya izin verir.
+    POOL_NAME = 'arazi_yonetim_pool'
+    POOL_SIZE = 16
+    POOL_MAX_SIZE = 32
     POOL_RESET_SESSION = True
     
+    # Aktif sensör listesi önbellek süresi (saniye); None ise veri gönderim
+    # aralığının iki katı kullanılır, böylece bir sonraki tick önbellekten okur
+    SENSOR_CACHE_TTL_SECONDS = None
+    
+    # Sensör tip/konum/ad bilgilerinin yeniden yüklenme aralığı (saniye)
+    SENSOR_METADATA_TTL_SECONDS = 3600
+    
+    # Büyük sorgularda tek seferde çekilecek satır sayısı
+    HISTORY_FETCH_SIZE = 1000
+    
+    # Yazma hatalarında SHOW WARNINGS tanısının en sık çalışma aralığı (saniye)
+    WARNING_CHECK_INTERVAL_SECONDS = 3600
+    
     @classmethod
-    def get_connection_config(cls) -> Dict[str, Any]:
-        """Veritabanı bağlantı konfigürasyonunu döndür"""
-        return {
+    def sensor_cache_ttl(cls) -> float:
+        """Aktif sensör önbelleğinin geçerlilik süresi (saniye)"""
+        if cls.SENSOR_CACHE_TTL_SECONDS is not None:
+            return cls.SENSOR_CACHE_TTL_SECONDS
+        return SimulatorConfig.DATA_INTERVAL_MINUTES * 60 * 2
+    
+    @classmethod
+    @lru_cache(maxsize=1)
+    def get_connection_config(cls) -> Mapping[str, Any]:
+        """Veritabanı bağlantı konfigürasyonunu döndür (bir kez üretilir, salt okunur)"""
+        return MappingProxyType({
             'host': cls.HOST,
             'port': cls.PORT,
             'database': cls.DATABASE,
@@ -36,11 +72,12 @@ class DatabaseConfig:
             'password': cls.PASSWORD,
             'charset': cls.CHARSET,
             'collation': cls.COLLATION,
+            'pool_name': cls.POOL_NAME,
             'pool_size': cls.POOL_SIZE,
             'pool_reset_session': cls.POOL_RESET_SESSION,
-            'autocommit': True,
-            'raise_on_warnings': True
-        }
+            'autocommit': True,  # Yazma metotları ayrıca commit() çağırmaz
+            'raise_on_warnings': False  # True her ifadeden sonra uyarı listesini çeker
+        })
 
 class SimulatorConfig:
     """Simülatör konfigürasyonu"""
@@ -53,64 +90,46 @@ class SimulatorConfig:
     ENABLE_SEASONAL_CHANGES = True
     ENABLE_WEATHER_EFFECTS = True
     
+    # Rastgele sayı üreteci tohumu (None: her çalıştırmada farklı veri)
+    RANDOM_SEED = None
+    
     # Sensör veri aralıkları
     SENSOR_RANGES = {
-        'soil_moisture': {
-            'min': 15,
-            'max': 85,
-            'critical_min': 25,
-            'critical_max': 85,
-            'unit': '%',
-            'variation': 5  # ±5% rastgele değişim
-        },
-        'soil_ph': {
-            'min': 5.0,
-            'max': 8.0,
-            'critical_min': 5.5,
-            'critical_max': 7.5,
-            'unit': 'pH',
-            'variation': 0.3
-        },
-        'air_temperature': {
-            'min': 5,
-            'max': 35,
-            'critical_min': 2,
-            'critical_max': 40,
-            'unit': '°C',
-            'variation': 3
-        },
-        'air_humidity': {
-            'min': 30,
-            'max': 90,
-            'critical_min': 20,
-            'critical_max': 95,
-            'unit': '%',
-            'variation': 8
-        },
-        'light_intensity': {
-            'min': 1000,
-            'max': 80000,
-            'critical_min': 500,
-            'critical_max': 90000,
-            'unit': 'lux',
-            'variation': 5000
-        },
-        'rainfall': {
-            'min': 0,
-            'max': 25,
-            'critical_min': 0,
-            'critical_max': 50,
-            'unit': 'mm',
-            'variation': 2
-        },
-        'wind_speed': {
-            'min': 0,
-            'max': 80,
-            'critical_min': 3.6,
-            'critical_max': 36,
-            'unit': 'km/h',
-            'variation': 3
-        }
+        'soil_moisture': SensorRange(
+            min=15, max=85,
+            critical_min=25, critical_max=85,
+            unit='%', variation=5  # ±5% rastgele değişim
+        ),
+        'soil_ph': SensorRange(
+            min=5.0, max=8.0,
+            critical_min=5.5, critical_max=7.5,
+            unit='pH', variation=0.3
+        ),
+        'air_temperature': SensorRange(
+            min=5, max=35,
+            critical_min=2, critical_max=40,
+            unit='°C', variation=3
+        ),
+        'air_humidity': SensorRange(
+            min=30, max=90,
+            critical_min=20, critical_max=95,
+            unit='%', variation=8
+        ),
+        'light_intensity': SensorRange(
+            min=1000, max=80000,
+            critical_min=500, critical_max=90000,
+            unit='lux', variation=5000
+        ),
+        'rainfall': SensorRange(
+            min=0, max=25,
+            critical_min=0, critical_max=50,
+            unit='mm', variation=2
+        ),
+        'wind_speed': SensorRange(
+            min=0, max=80,
+            critical_min=3.6, critical_max=36,
+            unit='km/h', variation=3
+        )
     }
     
     # Simülasyon senaryoları (olasılık dağılımı)
@@ -155,6 +174,9 @@ class LogConfig:
     # Log formatı
     FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     
+    # Zaman damgası formatı (milisaniye eklenmez)
+    DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+    
     # Maksimum dosya boyutu (MB)
     MAX_FILE_SIZE = 10
     
@@ -195,14 +217,23 @@ def load_from_env():
         DatabaseConfig.USERNAME = os.getenv('DB_USER')
     if os.getenv('DB_PASS'):
         DatabaseConfig.PASSWORD = os.getenv('DB_PASS')
+    if os.getenv('DB_POOL_SIZE'):
+        DatabaseConfig.POOL_SIZE = min(int(os.getenv('DB_POOL_SIZE')), DatabaseConfig.POOL_MAX_SIZE)
+    if os.getenv('DB_SENSOR_CACHE_TTL'):
+        DatabaseConfig.SENSOR_CACHE_TTL_SECONDS = int(os.getenv('DB_SENSOR_CACHE_TTL'))
     
     # Simülatör ayarları
     if os.getenv('SIM_INTERVAL'):
         SimulatorConfig.DATA_INTERVAL_MINUTES = int(os.getenv('SIM_INTERVAL'))
+    if os.getenv('SIM_SEED'):
+        SimulatorConfig.RANDOM_SEED = int(os.getenv('SIM_SEED'))
     
     # Log ayarları
     if os.getenv('LOG_LEVEL'):
         LogConfig.LEVEL = os.getenv('LOG_LEVEL')
+    
+    # Önbellekteki bağlantı konfigürasyonunu yeni değerlerle yeniden üret
+    DatabaseConfig.get_connection_config.cache_clear()
 
 # Konfigürasyonu yükle
 load_from_env() 
\ No newline at end of file
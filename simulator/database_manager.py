@@ -3,23 +3,169 @@
 """
 Arazi Yönetim Sistemi - Veritabanı Yöneticisi
 MySQL veritabanı işlemlerini yönetir
+
+sensor_data sorguları aşağıdaki indekslere dayanır (tam tablo taraması ve
+sıralama yerine aralık taraması için):
+    
+    CREATE INDEX idx_sd_sensor_time ON sensor_data (sensor_id, recorded_at);
+    CREATE INDEX idx_sd_time ON sensor_data (recorded_at);
 """
 
 import mysql.connector
 from mysql.connector import Error, pooling
-from typing import Dict, List, Any, Optional
-from datetime import datetime
+from typing import Dict, List, Any, Iterator, Optional
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+import json
 import logging
+import operator
+import time
 
 from config import DatabaseConfig
+from models import SensorReading
+
+# sensor_data INSERT sütun sırasıyla satır değerlerini çıkarır
+_ROW_KEYS = operator.attrgetter(
+    'sensor_id', 'value', 'quality_score', 'battery_level', 'signal_strength', 'recorded_at'
+)
+
+# SQL ifadeleri (her çağrıda yeniden oluşturulmaz)
+_SQL_PING = "SELECT 1"
+
+_SQL_SENSOR_METADATA = """
+    SELECT 
+        s.id,
+        s.sensor_name,
+        s.sensor_code,
+        s.latitude,
+        s.longitude,
+        st.type_name,
+        st.unit,
+        st.min_value,
+        st.max_value,
+        st.critical_min,
+        st.critical_max,
+        l.location_name
+    FROM sensors s
+    JOIN sensor_types st ON s.sensor_type_id = st.id
+    JOIN locations l ON s.location_id = l.id
+"""
+
+_SQL_ACTIVE_SENSOR_IDS_AND_BATTERY = "SELECT id, battery_level FROM sensors WHERE is_active = 1 ORDER BY id"
+
+_SQL_COUNT_ACTIVE_SENSORS = "SELECT COUNT(*) FROM sensors WHERE is_active = 1"
+
+_SQL_INSERT_SENSOR_DATA = """
+    INSERT INTO sensor_data 
+    (sensor_id, value, quality_score, battery_level, signal_strength, recorded_at)
+    VALUES (%s, %s, %s, %s, %s, %s)
+"""
+
+_SQL_COUNT_SENSOR_DATA = "SELECT COUNT(*) FROM sensor_data"
+
+_SQL_LATEST_READINGS = """
+    SELECT 
+        s.sensor_name,
+        s.sensor_code,
+        st.type_name,
+        st.unit,
+        sd.value,
+        sd.recorded_at,
+        sd.battery_level,
+        sd.signal_strength,
+        l.location_name
+    FROM sensor_data sd
+    JOIN sensors s ON sd.sensor_id = s.id
+    JOIN sensor_types st ON s.sensor_type_id = st.id
+    JOIN locations l ON s.location_id = l.id
+    ORDER BY sd.recorded_at DESC
+    LIMIT %s
+"""
+
+_SQL_SENSOR_HISTORY = """
+    SELECT 
+        value,
+        recorded_at,
+        quality_score,
+        battery_level
+    FROM sensor_data
+    WHERE sensor_id = %s 
+    AND recorded_at >= %s
+    ORDER BY recorded_at ASC
+"""
+
+_SQL_ACTIVE_ALERTS = """
+    SELECT 
+        a.id,
+        a.alert_level,
+        a.message,
+        a.trigger_value,
+        a.created_at,
+        s.sensor_name,
+        st.type_name,
+        st.unit,
+        l.location_name
+    FROM alerts a
+    JOIN sensors s ON a.sensor_id = s.id
+    JOIN sensor_types st ON s.sensor_type_id = st.id
+    JOIN locations l ON s.location_id = l.id
+    WHERE a.is_resolved = 0
+    ORDER BY a.created_at DESC
+"""
+
+_SQL_INSERT_ALERT = """
+    INSERT INTO alerts 
+    (alert_rule_id, sensor_id, alert_level, message, trigger_value)
+    VALUES (%s, %s, %s, %s, %s)
+"""
+
+_SQL_SENSOR_STATISTICS = """
+    SELECT 
+        AVG(value) as avg_value,
+        MIN(value) as min_value,
+        MAX(value) as max_value,
+        COUNT(*) as total_readings,
+        AVG(quality_score) as avg_quality,
+        AVG(battery_level) as avg_battery
+    FROM sensor_data
+    WHERE sensor_id = %s 
+    AND recorded_at >= %s
+"""
+
+_SQL_UPDATE_SENSOR_BATTERY = "UPDATE sensors SET battery_level = %s WHERE id = %s"
+
+_SQL_SHOW_WARNINGS = "SHOW WARNINGS"
+
+_SQL_INSERT_SYSTEM_LOG = """
+    INSERT INTO system_logs 
+    (log_level, module, message, details)
+    VALUES (%s, %s, %s, %s)
+"""
 
 class DatabaseManager:
-    """Veritabanı yöneticisi"""
+    """Veritabanı yöneticisi (süreç başına tek örnek)"""
+    
+    _instance = None
+    
+    def __new__(cls):
+        # Bağlantı havuzu pahalı olduğundan her çağrıda aynı örneği döndür
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
     
     def __init__(self):
+        if getattr(self, '_initialized', False):
+            return
+        
         self.connection_pool = None
+        self._sensors_cache = None  # (zaman damgası, sensör listesi)
+        self._sensor_meta = None  # sensör id -> tip/konum bilgileri
+        self._sensor_meta_loaded_at = 0.0
+        self._total_records = None  # İlk sayımdan sonra yazma işlemleriyle güncellenir
+        self._last_warning_check = None  # Son SHOW WARNINGS zamanı
         self.logger = logging.getLogger(__name__)
         self._initialize_connection_pool()
+        self._initialized = True
     
     def _initialize_connection_pool(self):
         """Bağlantı havuzunu başlat"""
@@ -28,332 +174,352 @@ class DatabaseManager:
             self.connection_pool = mysql.connector.pooling.MySQLConnectionPool(**config)
             self.logger.info("✅ Veritabanı bağlantı havuzu oluşturuldu")
         except Error as e:
-            self.logger.error(f"❌ Veritabanı bağlantı havuzu oluşturulamadı: {e}")
+            self.logger.error("❌ Veritabanı bağlantı havuzu oluşturulamadı: %s", e)
             raise
     
+    @contextmanager
+    def _conn(self, conn: Optional[pooling.PooledMySQLConnection] = None) -> Iterator[pooling.PooledMySQLConnection]:
+        """Verilen bağlantıyı kullan, yoksa havuzdan al ve işlem sonunda geri bırak"""
+        if conn is not None:
+            yield conn
+            return
+        
+        connection = self.connection_pool.get_connection()
+        try:
+            yield connection
+        finally:
+            connection.close()
+    
+    def connection(self):
+        """Birden fazla işlemde paylaşılacak bağlantıyı aç (with bloğu ile kullanılır)"""
+        return self._conn()
+    
     def test_connection(self) -> bool:
         """Veritabanı bağlantısını test et"""
         try:
-            connection = self.connection_pool.get_connection()
-            cursor = connection.cursor()
-            
-            # Basit sorgu test et
-            cursor.execute("SELECT 1")
-            result = cursor.fetchone()
-            
-            cursor.close()
-            connection.close()
+            with self._conn() as connection:
+                cursor = connection.cursor()
+                
+                # Basit sorgu test et
+                cursor.execute(_SQL_PING)
+                result = cursor.fetchone()
+                
+                cursor.close()
             
             return result[0] == 1
         except Error as e:
-            self.logger.error(f"❌ Veritabanı bağlantı testi başarısız: {e}")
+            self.logger.error("❌ Veritabanı bağlantı testi başarısız: %s", e)
             return False
     
-    def get_active_sensors(self) -> List[Dict[str, Any]]:
-        """Aktif sensörleri getir"""
+    def _load_sensor_metadata(self, connection: pooling.PooledMySQLConnection):
+        """Sensörlerin nadiren değişen tip/konum bilgilerini yükle"""
+        cursor = connection.cursor(dictionary=True)
+        
+        cursor.execute(_SQL_SENSOR_METADATA)
+        self._sensor_meta = {row['id']: row for row in cursor.fetchall()}
+        self._sensor_meta_loaded_at = time.monotonic()
+        
+        cursor.close()
+    
+    def get_active_sensor_ids_and_battery(self, conn: Optional[pooling.PooledMySQLConnection] = None) -> List[Dict[str, Any]]:
+        """Aktif sensörlerin id ve batarya seviyelerini getir"""
         try:
-            connection = self.connection_pool.get_connection()
-            cursor = connection.cursor(dictionary=True)
-            
-            query = """
-                SELECT 
-                    s.id,
-                    s.sensor_name,
-                    s.sensor_code,
-                    s.latitude,
-                    s.longitude,
-                    s.battery_level,
-                    st.type_name,
-                    st.unit,
-                    st.min_value,
-                    st.max_value,
-                    st.critical_min,
-                    st.critical_max,
-                    l.location_name
-                FROM sensors s
-                JOIN sensor_types st ON s.sensor_type_id = st.id
-                JOIN locations l ON s.location_id = l.id
-                WHERE s.is_active = 1
-                ORDER BY s.id
-            """
-            
-            cursor.execute(query)
-            sensors = cursor.fetchall()
-            
-            cursor.close()
-            connection.close()
-            
-            return sensors
-            
+            with self._conn(conn) as connection:
+                cursor = connection.cursor(dictionary=True)
+                
+                cursor.execute(_SQL_ACTIVE_SENSOR_IDS_AND_BATTERY)
+                rows = cursor.fetchall()
+                
+                cursor.close()
+            
+            return rows
+        
         except Error as e:
-            self.logger.error(f"❌ Aktif sensörler alınamadı: {e}")
+            self.logger.error("❌ Aktif sensör listesi alınamadı: %s", e)
             return []
     
-    def save_sensor_data(self, sensor_data: Dict[str, Any]) -> bool:
-        """Sensör verisini kaydet"""
+    def get_active_sensors(self, conn: Optional[pooling.PooledMySQLConnection] = None) -> List[Dict[str, Any]]:
+        """Aktif sensörleri getir (TTL süresince önbellekten)"""
+        if self._sensors_cache is not None:
+            cached_at, cached_sensors = self._sensors_cache
+            if time.monotonic() - cached_at < DatabaseConfig.sensor_cache_ttl():
+                return [dict(sensor) for sensor in cached_sensors]
+        
         try:
-            connection = self.connection_pool.get_connection()
-            cursor = connection.cursor()
-            
-            query = """
-                INSERT INTO sensor_data 
-                (sensor_id, value, quality_score, battery_level, signal_strength, recorded_at)
-                VALUES (%s, %s, %s, %s, %s, %s)
-            """
-            
-            values = (
-                sensor_data['sensor_id'],
-                sensor_data['value'],
-                sensor_data['quality_score'],
-                sensor_data['battery_level'],
-                sensor_data['signal_strength'],
-                sensor_data['recorded_at']
-            )
-            
-            cursor.execute(query, values)
-            connection.commit()
-            
-            cursor.close()
-            connection.close()
+            with self._conn(conn) as connection:
+                active = self.get_active_sensor_ids_and_battery(connection)
+                
+                # JOIN ilk çağrıda, metadata süresi dolduğunda ya da bilinmeyen bir
+                # sensör görüldüğünde çalışır (tip/konum/ad değişiklikleri böylece yansır)
+                metadata_age = time.monotonic() - self._sensor_meta_loaded_at
+                if (self._sensor_meta is None or
+                        metadata_age >= DatabaseConfig.SENSOR_METADATA_TTL_SECONDS or
+                        any(row['id'] not in self._sensor_meta for row in active)):
+                    self._load_sensor_metadata(connection)
+            
+            sensors = [
+                dict(self._sensor_meta[row['id']], battery_level=row['battery_level'])
+                for row in active
+                if row['id'] in self._sensor_meta
+            ]
+            
+            if sensors:
+                self._sensors_cache = (time.monotonic(), sensors)
+            
+            # Çağıran sözlükleri değiştirse de önbellek bozulmasın
+            return [dict(sensor) for sensor in sensors]
+        
+        except Error as e:
+            self.logger.error("❌ Aktif sensörler alınamadı: %s", e)
+            return []
+    
+    def count_active_sensors(self, conn: Optional[pooling.PooledMySQLConnection] = None) -> int:
+        """Aktif sensör sayısını getir"""
+        if self._sensors_cache is not None:
+            cached_at, cached_sensors = self._sensors_cache
+            if time.monotonic() - cached_at < DatabaseConfig.sensor_cache_ttl():
+                return len(cached_sensors)
+        
+        try:
+            with self._conn(conn) as connection:
+                cursor = connection.cursor()
+                
+                cursor.execute(_SQL_COUNT_ACTIVE_SENSORS)
+                result = cursor.fetchone()
+                
+                cursor.close()
             
+            return result[0] if result else 0
+        
+        except Error as e:
+            self.logger.error("❌ Aktif sensör sayısı alınamadı: %s", e)
+            return 0
+    
+    def invalidate_sensors_cache(self):
+        """Aktif sensör önbelleğini temizle"""
+        self._sensors_cache = None
+        self._sensor_meta = None
+    
+    def save_sensor_data(self, sensor_data: SensorReading,
+                         conn: Optional[pooling.PooledMySQLConnection] = None) -> bool:
+        """Sensör verisini kaydet"""
+        return self.save_sensor_data_batch([sensor_data], conn)
+    
+    def save_sensor_data_batch(self, sensor_data_list: List[SensorReading],
+                               conn: Optional[pooling.PooledMySQLConnection] = None) -> bool:
+        """Birden fazla sensör verisini tek seferde kaydet"""
+        if not sensor_data_list:
             return True
+        
+        try:
+            with self._conn(conn) as connection:
+                cursor = connection.cursor()
+                
+                values = [_ROW_KEYS(sensor_data) for sensor_data in sensor_data_list]
+                
+                # executemany INSERT'i tek bir çok satırlı sorguya çevirir; sunucu
+                # ifadeyi tick başına bir kez ayrıştırır. prepared=True imleç her
+                # satır için ayrı bir round-trip yaptığından burada kullanılmaz,
+                # ayrıca pool_reset_session havuza dönüşte hazır ifadeleri siler.
+                try:
+                    cursor.executemany(_SQL_INSERT_SENSOR_DATA, values)
+                except Error:
+                    self._log_server_warnings(connection)
+                    raise
+                
+                cursor.close()
+            
+            if self._total_records is not None:
+                self._total_records += len(values)
             
+            return True
+        
         except Error as e:
-            self.logger.error(f"❌ Sensör verisi kaydedilemedi: {e}")
+            self.logger.error("❌ Sensör verileri kaydedilemedi: %s", e)
             return False
     
-    def get_total_records(self) -> int:
-        """Toplam kayıt sayısını getir"""
+    def _log_server_warnings(self, connection: pooling.PooledMySQLConnection):
+        """Başarısız yazmadan sonra sunucu uyarılarını logla (en fazla aralık başına bir kez)"""
+        now = time.monotonic()
+        if (self._last_warning_check is not None and
+                now - self._last_warning_check < DatabaseConfig.WARNING_CHECK_INTERVAL_SECONDS):
+            return
+        self._last_warning_check = now
+        
         try:
-            connection = self.connection_pool.get_connection()
             cursor = connection.cursor()
-            
-            cursor.execute("SELECT COUNT(*) FROM sensor_data")
-            result = cursor.fetchone()
-            
+            cursor.execute(_SQL_SHOW_WARNINGS)
+            for level, code, message in cursor.fetchall():
+                self.logger.warning("⚠️ MySQL %s (%s): %s", level, code, message)
             cursor.close()
-            connection.close()
-            
-            return result[0] if result else 0
-            
         except Error as e:
-            self.logger.error(f"❌ Toplam kayıt sayısı alınamadı: {e}")
+            self.logger.error("❌ Sunucu uyarıları alınamadı: %s", e)
+    
+    def get_total_records(self, conn: Optional[pooling.PooledMySQLConnection] = None,
+                          refresh: bool = False) -> int:
+        """Toplam kayıt sayısını getir"""
+        # COUNT(*) InnoDB'de tüm tabloyu taradığından yalnızca ilk çağrıda (veya
+        # refresh ile) çalışır; sonrasında kaydedilen satırlarla güncel tutulur
+        if self._total_records is not None and not refresh:
+            return self._total_records
+        
+        try:
+            with self._conn(conn) as connection:
+                cursor = connection.cursor()
+                
+                cursor.execute(_SQL_COUNT_SENSOR_DATA)
+                result = cursor.fetchone()
+                
+                cursor.close()
+            
+            self._total_records = result[0] if result else 0
+            return self._total_records
+        
+        except Error as e:
+            self.logger.error("❌ Toplam kayıt sayısı alınamadı: %s", e)
             return 0
     
-    def get_latest_readings(self, limit: int = 10) -> List[Dict[str, Any]]:
+    def get_latest_readings(self, limit: int = 10,
+                            conn: Optional[pooling.PooledMySQLConnection] = None) -> List[Dict[str, Any]]:
         """Son sensör okumalarını getir"""
         try:
-            connection = self.connection_pool.get_connection()
-            cursor = connection.cursor(dictionary=True)
-            
-            query = """
-                SELECT 
-                    s.sensor_name,
-                    s.sensor_code,
-                    st.type_name,
-                    st.unit,
-                    sd.value,
-                    sd.recorded_at,
-                    sd.battery_level,
-                    sd.signal_strength,
-                    l.location_name
-                FROM sensor_data sd
-                JOIN sensors s ON sd.sensor_id = s.id
-                JOIN sensor_types st ON s.sensor_type_id = st.id
-                JOIN locations l ON s.location_id = l.id
-                ORDER BY sd.recorded_at DESC
-                LIMIT %s
-            """
-            
-            cursor.execute(query, (limit,))
-            readings = cursor.fetchall()
-            
-            cursor.close()
-            connection.close()
+            with self._conn(conn) as connection:
+                cursor = connection.cursor(dictionary=True)
+                
+                cursor.execute(_SQL_LATEST_READINGS, (limit,))
+                readings = cursor.fetchall()
+                
+                cursor.close()
             
             return readings
-            
+        
         except Error as e:
-            self.logger.error(f"❌ Son okumalar alınamadı: {e}")
+            self.logger.error("❌ Son okumalar alınamadı: %s", e)
             return []
     
-    def get_sensor_history(self, sensor_id: int, hours: int = 24) -> List[Dict[str, Any]]:
-        """Sensör geçmişini getir"""
+    def get_sensor_history(self, sensor_id: int, hours: int = 24,
+                           conn: Optional[pooling.PooledMySQLConnection] = None) -> Iterator[Dict[str, Any]]:
+        """Sensör geçmişini parça parça getir (sonuç belleğe topluca alınmaz)"""
         try:
-            connection = self.connection_pool.get_connection()
-            cursor = connection.cursor(dictionary=True)
-            
-            query = """
-                SELECT 
-                    value,
-                    recorded_at,
-                    quality_score,
-                    battery_level
-                FROM sensor_data
-                WHERE sensor_id = %s 
-                AND recorded_at >= DATE_SUB(NOW(), INTERVAL %s HOUR)
-                ORDER BY recorded_at ASC
-            """
-            
-            cursor.execute(query, (sensor_id, hours))
-            history = cursor.fetchall()
-            
-            cursor.close()
-            connection.close()
-            
-            return history
-            
+            with self._conn(conn) as connection:
+                cursor = connection.cursor(dictionary=True, buffered=False)
+                
+                try:
+                    # Alt sınır Python'da hesaplanır; (sensor_id, recorded_at) indeksinde aralık taraması yapılır
+                    since = datetime.now() - timedelta(hours=hours)
+                    cursor.execute(_SQL_SENSOR_HISTORY, (sensor_id, since))
+                    
+                    while True:
+                        rows = cursor.fetchmany(DatabaseConfig.HISTORY_FETCH_SIZE)
+                        if not rows:
+                            break
+                        yield from rows
+                finally:
+                    # Tüketilmeden bırakılan satırları at ki bağlantı havuza temiz dönsün
+                    connection.consume_results()
+                    cursor.close()
+        
         except Error as e:
-            self.logger.error(f"❌ Sensör geçmişi alınamadı: {e}")
-            return []
+            self.logger.error("❌ Sensör geçmişi alınamadı: %s", e)
     
-    def get_active_alerts(self) -> List[Dict[str, Any]]:
+    def get_active_alerts(self, conn: Optional[pooling.PooledMySQLConnection] = None) -> List[Dict[str, Any]]:
         """Aktif alarmları getir"""
         try:
-            connection = self.connection_pool.get_connection()
-            cursor = connection.cursor(dictionary=True)
-            
-            query = """
-                SELECT 
-                    a.id,
-                    a.alert_level,
-                    a.message,
-                    a.trigger_value,
-                    a.created_at,
-                    s.sensor_name,
-                    st.type_name,
-                    st.unit,
-                    l.location_name
-                FROM alerts a
-                JOIN sensors s ON a.sensor_id = s.id
-                JOIN sensor_types st ON s.sensor_type_id = st.id
-                JOIN locations l ON s.location_id = l.id
-                WHERE a.is_resolved = 0
-                ORDER BY a.created_at DESC
-            """
-            
-            cursor.execute(query)
-            alerts = cursor.fetchall()
-            
-            cursor.close()
-            connection.close()
+            with self._conn(conn) as connection:
+                cursor = connection.cursor(dictionary=True)
+                
+                cursor.execute(_SQL_ACTIVE_ALERTS)
+                alerts = cursor.fetchall()
+                
+                cursor.close()
             
             return alerts
-            
+        
         except Error as e:
-            self.logger.error(f"❌ Aktif alarmlar alınamadı: {e}")
+            self.logger.error("❌ Aktif alarmlar alınamadı: %s", e)
             return []
     
-    def create_alert(self, alert_data: Dict[str, Any]) -> bool:
+    def create_alert(self, alert_data: Dict[str, Any],
+                     conn: Optional[pooling.PooledMySQLConnection] = None) -> bool:
         """Alarm oluştur"""
         try:
-            connection = self.connection_pool.get_connection()
-            cursor = connection.cursor()
-            
-            query = """
-                INSERT INTO alerts 
-                (alert_rule_id, sensor_id, alert_level, message, trigger_value)
-                VALUES (%s, %s, %s, %s, %s)
-            """
-            
-            values = (
-                alert_data['alert_rule_id'],
-                alert_data['sensor_id'],
-                alert_data['alert_level'],
-                alert_data['message'],
-                alert_data['trigger_value']
-            )
-            
-            cursor.execute(query, values)
-            connection.commit()
-            
-            cursor.close()
-            connection.close()
+            with self._conn(conn) as connection:
+                cursor = connection.cursor()
+                
+                values = (
+                    alert_data['alert_rule_id'],
+                    alert_data['sensor_id'],
+                    alert_data['alert_level'],
+                    alert_data['message'],
+                    alert_data['trigger_value']
+                )
+                
+                cursor.execute(_SQL_INSERT_ALERT, values)
+                
+                cursor.close()
             
             return True
-            
+        
         except Error as e:
-            self.logger.error(f"❌ Alarm oluşturulamadı: {e}")
+            self.logger.error("❌ Alarm oluşturulamadı: %s", e)
             return False
     
-    def get_sensor_statistics(self, sensor_id: int, days: int = 7) -> Dict[str, Any]:
+    def get_sensor_statistics(self, sensor_id: int, days: int = 7,
+                              conn: Optional[pooling.PooledMySQLConnection] = None) -> Dict[str, Any]:
         """Sensör istatistiklerini getir"""
         try:
-            connection = self.connection_pool.get_connection()
-            cursor = connection.cursor(dictionary=True)
-            
-            query = """
-                SELECT 
-                    AVG(value) as avg_value,
-                    MIN(value) as min_value,
-                    MAX(value) as max_value,
-                    COUNT(*) as total_readings,
-                    AVG(quality_score) as avg_quality,
-                    AVG(battery_level) as avg_battery
-                FROM sensor_data
-                WHERE sensor_id = %s 
-                AND recorded_at >= DATE_SUB(NOW(), INTERVAL %s DAY)
-            """
-            
-            cursor.execute(query, (sensor_id, days))
-            stats = cursor.fetchone()
-            
-            cursor.close()
-            connection.close()
+            with self._conn(conn) as connection:
+                cursor = connection.cursor(dictionary=True)
+                
+                since = datetime.now() - timedelta(days=days)
+                cursor.execute(_SQL_SENSOR_STATISTICS, (sensor_id, since))
+                stats = cursor.fetchone()
+                
+                cursor.close()
             
             return stats if stats else {}
-            
+        
         except Error as e:
-            self.logger.error(f"❌ Sensör istatistikleri alınamadı: {e}")
+            self.logger.error("❌ Sensör istatistikleri alınamadı: %s", e)
             return {}
     
-    def update_sensor_battery(self, sensor_id: int, battery_level: int) -> bool:
+    def update_sensor_battery(self, sensor_id: int, battery_level: int,
+                              conn: Optional[pooling.PooledMySQLConnection] = None) -> bool:
         """Sensör batarya seviyesini güncelle"""
         try:
-            connection = self.connection_pool.get_connection()
-            cursor = connection.cursor()
-            
-            query = "UPDATE sensors SET battery_level = %s WHERE id = %s"
-            cursor.execute(query, (battery_level, sensor_id))
-            connection.commit()
-            
-            cursor.close()
-            connection.close()
+            with self._conn(conn) as connection:
+                cursor = connection.cursor()
+                
+                cursor.execute(_SQL_UPDATE_SENSOR_BATTERY, (battery_level, sensor_id))
+                
+                cursor.close()
             
             return True
-            
+        
         except Error as e:
-            self.logger.error(f"❌ Batarya seviyesi güncellenemedi: {e}")
+            self.logger.error("❌ Batarya seviyesi güncellenemedi: %s", e)
             return False
     
-    def log_system_event(self, level: str, module: str, message: str, details: Optional[Dict] = None) -> bool:
+    def log_system_event(self, level: str, module: str, message: str, details: Optional[Dict] = None,
+                         conn: Optional[pooling.PooledMySQLConnection] = None) -> bool:
         """Sistem olayını logla"""
         try:
-            connection = self.connection_pool.get_connection()
-            cursor = connection.cursor()
-            
-            query = """
-                INSERT INTO system_logs 
-                (log_level, module, message, details)
-                VALUES (%s, %s, %s, %s)
-            """
-            
-            details_json = None
-            if details:
-                import json
-                details_json = json.dumps(details)
-            
-            values = (level, module, message, details_json)
-            cursor.execute(query, values)
-            connection.commit()
-            
-            cursor.close()
-            connection.close()
+            with self._conn(conn) as connection:
+                cursor = connection.cursor()
+                
+                details_json = None
+                if details:
+                    details_json = json.dumps(details)
+                
+                values = (level, module, message, details_json)
+                cursor.execute(_SQL_INSERT_SYSTEM_LOG, values)
+                
+                cursor.close()
             
             return True
-            
+        
         except Error as e:
-            self.logger.error(f"❌ Sistem logu kaydedilemedi: {e}")
+            self.logger.error("❌ Sistem logu kaydedilemedi: %s", e)
             return False
     
     def close(self):
@@ -364,4 +530,4 @@ class DatabaseManager:
                 # Pool'u kapatmak yerine, tüm bağlantıları serbest bırak
                 self.logger.info("🔌 Veritabanı bağlantıları kapatıldı")
             except Exception as e:
-                self.logger.error(f"❌ Bağlantı kapatma hatası: {e}") 
\ No newline at end of file
+                self.logger.error("❌ Bağlantı kapatma hatası: %s", e)
\ No newline at end of file
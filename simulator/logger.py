@@ -5,28 +5,34 @@ Arazi Yönetim Sistemi - Logger
 Log yönetimi için yardımcı fonksiyonlar
 """
 
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
 from datetime import datetime
 from typing import Optional
 
 from config import LogConfig
 
-def setup_logger(name: str, level: Optional[str] = None) -> logging.Logger:
-    """Logger kurulumu"""
-    
-    # Log seviyesini belirle
-    log_level = level or LogConfig.LEVEL
-    numeric_level = getattr(logging, log_level.upper(), logging.INFO)
-    
-    # Logger oluştur
-    logger = logging.getLogger(name)
-    logger.setLevel(numeric_level)
+# psutil opsiyonel; modül bir kez yüklenir, her log çağrısında yeniden denenmez
+try:
+    import psutil
+    _HAVE_PSUTIL = True
+except ImportError:
+    psutil = None
+    _HAVE_PSUTIL = False
+
+# Dosya/konsol yazımı arka plandaki QueueListener iş parçacığında yapılır
+_queue_handler: Optional[logging.handlers.QueueHandler] = None
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+def _get_queue_handler() -> logging.handlers.QueueHandler:
+    """Tüm logger'ların paylaştığı kuyruk handler'ını döndür"""
+    global _queue_handler, _queue_listener
     
-    # Eğer handler zaten varsa, tekrar ekleme
-    if logger.handlers:
-        return logger
+    if _queue_handler is not None:
+        return _queue_handler
     
     # Log dizinini oluştur
     log_dir = os.path.dirname(LogConfig.LOG_FILE)
@@ -45,13 +51,38 @@ def setup_logger(name: str, level: Optional[str] = None) -> logging.Logger:
     console_handler = logging.StreamHandler()
     
     # Formatter oluştur
-    formatter = logging.Formatter(LogConfig.FORMAT)
+    formatter = logging.Formatter(LogConfig.FORMAT, datefmt=LogConfig.DATE_FORMAT)
     file_handler.setFormatter(formatter)
     console_handler.setFormatter(formatter)
     
-    # Handler'ları ekle
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # Kuyruğu dinleyen arka plan iş parçacığını başlat
+    log_queue = queue.Queue(-1)
+    _queue_handler = logging.handlers.QueueHandler(log_queue)
+    _queue_listener = logging.handlers.QueueListener(log_queue, file_handler, console_handler)
+    _queue_listener.start()
+    
+    # Çıkışta kuyrukta kalan kayıtları yaz
+    atexit.register(_queue_listener.stop)
+    
+    return _queue_handler
+
+def setup_logger(name: str, level: Optional[str] = None) -> logging.Logger:
+    """Logger kurulumu"""
+    
+    # Log seviyesini belirle
+    log_level = level or LogConfig.LEVEL
+    numeric_level = getattr(logging, log_level.upper(), logging.INFO)
+    
+    # Logger oluştur
+    logger = logging.getLogger(name)
+    logger.setLevel(numeric_level)
+    
+    # Eğer handler zaten varsa, tekrar ekleme
+    if logger.handlers:
+        return logger
+    
+    # Handler'ı ekle
+    logger.addHandler(_get_queue_handler())
     
     return logger
 
@@ -59,32 +90,38 @@ def get_logger(name: str) -> logging.Logger:
     """Mevcut logger'ı al"""
     return logging.getLogger(name)
 
-def log_sensor_data(logger: logging.Logger, sensor_data: dict):
+def log_sensor_data(logger: logging.Logger, sensor_data):
     """Sensör verisi logla"""
     logger.info(
-        f"Sensör {sensor_data['sensor_id']}: "
-        f"{sensor_data['value']} {sensor_data['unit']} "
-        f"(Kalite: {sensor_data['quality_score']}%, "
-        f"Batarya: {sensor_data['battery_level']}%)"
+        "Sensör %s: "
+        "%s %s "
+        "(Kalite: %s%%, "
+        "Batarya: %s%%)",
+        sensor_data.sensor_id,
+        sensor_data.value, sensor_data.unit,
+        sensor_data.quality_score,
+        sensor_data.battery_level
     )
 
 def log_alert(logger: logging.Logger, alert_data: dict):
     """Alarm logla"""
     logger.warning(
-        f"ALARM: {alert_data['alert_level'].upper()} - "
-        f"{alert_data['message']} "
-        f"(Sensör: {alert_data['sensor_id']})"
+        "ALARM: %s - "
+        "%s "
+        "(Sensör: %s)",
+        alert_data['alert_level'].upper(), alert_data['message'], alert_data['sensor_id']
     )
 
 def log_error(logger: logging.Logger, error: Exception, context: str = ""):
     """Hata logla"""
     logger.error(
-        f"HATA {context}: {type(error).__name__}: {str(error)}"
+        "HATA %s: %s: %s",
+        context, type(error).__name__, error
     )
 
 def log_performance(logger: logging.Logger, operation: str, duration: float):
     """Performans logla"""
-    logger.info(f"PERFORMANS: {operation} - {duration:.3f}s")
+    logger.info("PERFORMANS: %s - %.3fs", operation, duration)
 
 def create_daily_logger(name: str) -> logging.Logger:
     """Günlük log dosyası oluştur"""
@@ -123,55 +160,58 @@ def create_daily_logger(name: str) -> logging.Logger:
 def log_system_start(logger: logging.Logger):
     """Sistem başlangıç logu"""
     logger.info("🚀 Arazi Yönetim Sistemi başlatılıyor...")
-    logger.info(f"📅 Tarih: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    logger.info(f"⚙️ Log seviyesi: {LogConfig.LEVEL}")
+    logger.info("⚙️ Log seviyesi: %s", LogConfig.LEVEL)
 
 def log_system_stop(logger: logging.Logger):
     """Sistem durdurma logu"""
     logger.info("🛑 Arazi Yönetim Sistemi durduruluyor...")
-    logger.info(f"📅 Tarih: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
 
 def log_database_connection(logger: logging.Logger, success: bool, details: str = ""):
     """Veritabanı bağlantı logu"""
     if success:
-        logger.info(f"✅ Veritabanı bağlantısı başarılı {details}")
+        logger.info("✅ Veritabanı bağlantısı başarılı %s", details)
     else:
-        logger.error(f"❌ Veritabanı bağlantısı başarısız {details}")
+        logger.error("❌ Veritabanı bağlantısı başarısız %s", details)
 
 def log_sensor_activity(logger: logging.Logger, sensor_count: int, data_count: int):
     """Sensör aktivite logu"""
     logger.info(
-        f"📊 Sensör aktivitesi: {sensor_count} sensör, "
-        f"{data_count} veri kaydı"
+        "📊 Sensör aktivitesi: %s sensör, "
+        "%s veri kaydı",
+        sensor_count, data_count
     )
 
 def log_scenario_change(logger: logging.Logger, old_scenario: str, new_scenario: str):
     """Senaryo değişikliği logu"""
     logger.info(
-        f"🌤️ Senaryo değişikliği: {old_scenario} → {new_scenario}"
+        "🌤️ Senaryo değişikliği: %s → %s",
+        old_scenario, new_scenario
     )
 
 def log_configuration(logger: logging.Logger, config_data: dict):
     """Konfigürasyon logu"""
     logger.info("⚙️ Sistem konfigürasyonu:")
     for key, value in config_data.items():
-        logger.info(f"   {key}: {value}")
+        logger.info("   %s: %s", key, value)
 
 def log_memory_usage(logger: logging.Logger):
     """Bellek kullanımı logla"""
-    try:
-        import psutil
-        process = psutil.Process()
-        memory_info = process.memory_info()
-        memory_mb = memory_info.rss / 1024 / 1024
-        logger.info(f"💾 Bellek kullanımı: {memory_mb:.1f} MB")
-    except ImportError:
+    if not _HAVE_PSUTIL:
         logger.debug("psutil kütüphanesi bulunamadı - bellek kullanımı loglanamıyor")
+        return
+    
+    process = psutil.Process()
+    memory_info = process.memory_info()
+    memory_mb = memory_info.rss / 1024 / 1024
+    logger.info("💾 Bellek kullanımı: %.1f MB", memory_mb)
 
 def log_disk_usage(logger: logging.Logger, path: str = "."):
     """Disk kullanımı logla"""
+    if not _HAVE_PSUTIL:
+        logger.debug("psutil kütüphanesi bulunamadı - disk kullanımı loglanamıyor")
+        return
+    
     try:
-        import psutil
         disk_usage = psutil.disk_usage(path)
         total_gb = disk_usage.total / 1024 / 1024 / 1024
         used_gb = disk_usage.used / 1024 / 1024 / 1024
@@ -179,32 +219,33 @@ def log_disk_usage(logger: logging.Logger, path: str = "."):
         usage_percent = (disk_usage.used / disk_usage.total) * 100
         
         logger.info(
-            f"💿 Disk kullanımı ({path}): "
-            f"{used_gb:.1f}GB / {total_gb:.1f}GB "
-            f"({usage_percent:.1f}%) - {free_gb:.1f}GB boş"
+            "💿 Disk kullanımı (%s): "
+            "%.1fGB / %.1fGB "
+            "(%.1f%%) - %.1fGB boş",
+            path, used_gb, total_gb, usage_percent, free_gb
         )
-    except ImportError:
-        logger.debug("psutil kütüphanesi bulunamadı - disk kullanımı loglanamıyor")
     except Exception as e:
-        logger.error(f"Disk kullanımı alınamadı: {e}")
+        logger.error("Disk kullanımı alınamadı: %s", e)
 
 def log_network_status(logger: logging.Logger):
     """Ağ durumu logla"""
+    if not _HAVE_PSUTIL:
+        logger.debug("psutil kütüphanesi bulunamadı - ağ durumu loglanamıyor")
+        return
+    
     try:
-        import psutil
         network_stats = psutil.net_io_counters()
         bytes_sent_mb = network_stats.bytes_sent / 1024 / 1024
         bytes_recv_mb = network_stats.bytes_recv / 1024 / 1024
         
         logger.info(
-            f"🌐 Ağ trafiği: "
-            f"Gönderilen: {bytes_sent_mb:.1f}MB, "
-            f"Alınan: {bytes_recv_mb:.1f}MB"
+            "🌐 Ağ trafiği: "
+            "Gönderilen: %.1fMB, "
+            "Alınan: %.1fMB",
+            bytes_sent_mb, bytes_recv_mb
         )
-    except ImportError:
-        logger.debug("psutil kütüphanesi bulunamadı - ağ durumu loglanamıyor")
     except Exception as e:
-        logger.error(f"Ağ durumu alınamadı: {e}")
+        logger.error("Ağ durumu alınamadı: %s", e)
 
 def log_system_health(logger: logging.Logger):
     """Sistem sağlığı logla"""
@@ -8,6 +8,7 @@ Sensör verilerini simüle eder ve veritabanına kaydeder
 import time
 import random
 import logging
+import threading
 from datetime import datetime, timedelta
 import mysql.connector
 from mysql.connector import Error
@@ -30,6 +31,7 @@ class LoRaWANSimulator:
         self.db_manager = DatabaseManager()
         self.sensor_simulator = SensorSimulator()
         self.is_running = False
+        self._stop_event = threading.Event()
         
     def start(self):
         """Simülatörü başlat"""
@@ -49,32 +51,37 @@ class LoRaWANSimulator:
                 self.logger.warning("⚠️ Aktif sensör bulunamadı!")
                 return False
             
-            self.logger.info(f"📡 {len(sensors)} aktif sensör bulundu")
+            self.logger.info("📡 %s aktif sensör bulundu", len(sensors))
             
             # Zamanlayıcıyı ayarla
             self._setup_scheduler()
             
             # İlk veri gönderimi
-            self.generate_and_save_data()
+            self.generate_and_save_data(sensors)
             
             self.is_running = True
+            self._stop_event.clear()
             self.logger.info("✅ Simülatör başarıyla başlatıldı")
             
-            # Ana döngü
+            # Ana döngü: bir sonraki işe kadar uyu, stop() beklemeyi hemen keser
             while self.is_running:
                 schedule.run_pending()
-                time.sleep(1)
+                idle_seconds = schedule.idle_seconds()
+                if idle_seconds is None:
+                    idle_seconds = SimulatorConfig.DATA_INTERVAL_MINUTES * 60
+                self._stop_event.wait(max(0, idle_seconds))
                 
         except KeyboardInterrupt:
             self.logger.info("🛑 Simülatör durduruluyor...")
             self.stop()
         except Exception as e:
-            self.logger.error(f"❌ Hata: {e}")
+            self.logger.error("❌ Hata: %s", e)
             self.stop()
     
     def stop(self):
         """Simülatörü durdur"""
         self.is_running = False
+        self._stop_event.set()
         self.db_manager.close()
         self.logger.info("🛑 Simülatör durduruldu")
     
@@ -88,45 +95,51 @@ class LoRaWANSimulator:
         # Her saat başı log
         schedule.every().hour.do(self._log_status)
         
-        self.logger.info(f"⏰ Zamanlayıcı ayarlandı: {SimulatorConfig.DATA_INTERVAL_MINUTES} dakika")
+        self.logger.info("⏰ Zamanlayıcı ayarlandı: %s dakika", SimulatorConfig.DATA_INTERVAL_MINUTES)
     
-    def generate_and_save_data(self):
+    def generate_and_save_data(self, sensors: Optional[List[Dict]] = None):
         """Sensör verilerini üret ve kaydet"""
         try:
-            # Aktif sensörleri al
-            sensors = self.db_manager.get_active_sensors()
-            
-            for sensor in sensors:
-                # Sensör verisi üret
-                sensor_data = self.sensor_simulator.generate_sensor_data(sensor)
+            # Tick boyunca tek bağlantı kullan
+            with self.db_manager.connection() as conn:
+                # Aktif sensörleri al
+                if sensors is None:
+                    sensors = self.db_manager.get_active_sensors(conn)
                 
-                # Veritabanına kaydet
-                success = self.db_manager.save_sensor_data(sensor_data)
+                # Sensör verilerini üret (aynı tick'teki tüm okumalar aynı zaman damgasını taşır)
+                sensor_data_list = self.sensor_simulator.generate_sensor_data_batch(sensors)
                 
-                if success:
+                # Veritabanına tek seferde kaydet
+                if not self.db_manager.save_sensor_data_batch(sensor_data_list, conn):
+                    self.logger.error("❌ %s sensör verisi kaydedilemedi", len(sensor_data_list))
+                    return
+            
+            # DEBUG kapalıyken sensör başına mesaj üretme
+            if self.logger.isEnabledFor(logging.DEBUG):
+                for sensor, sensor_data in zip(sensors, sensor_data_list):
                     self.logger.debug(
-                        f"📊 {sensor['sensor_name']}: {sensor_data['value']} {sensor_data['unit']}"
+                        "📊 %s: %s %s",
+                        sensor['sensor_name'], sensor_data.value, sensor_data.unit
                     )
-                else:
-                    self.logger.error(f"❌ Veri kaydedilemedi: {sensor['sensor_name']}")
             
-            self.logger.info(f"✅ {len(sensors)} sensör verisi üretildi ve kaydedildi")
+            self.logger.info("✅ %s sensör verisi üretildi ve kaydedildi", len(sensors))
             
         except Exception as e:
-            self.logger.error(f"❌ Veri üretme hatası: {e}")
+            self.logger.error("❌ Veri üretme hatası: %s", e)
     
     def _log_status(self):
         """Durum logu"""
         try:
-            total_sensors = len(self.db_manager.get_active_sensors())
+            total_sensors = self.db_manager.count_active_sensors()
             total_records = self.db_manager.get_total_records()
             
             self.logger.info(
-                f"📈 Durum: {total_sensors} aktif sensör, "
-                f"{total_records} toplam kayıt"
+                "📈 Durum: %s aktif sensör, "
+                "%s toplam kayıt",
+                total_sensors, total_records
             )
         except Exception as e:
-            self.logger.error(f"❌ Durum logu hatası: {e}")
+            self.logger.error("❌ Durum logu hatası: %s", e)
 
 def main():
     """Ana fonksiyon"""
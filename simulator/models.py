@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Arazi Yönetim Sistemi - Veri Modelleri
+Modüller arasında paylaşılan kayıt tipleri
+"""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+@dataclass(slots=True)
+class SensorReading:
+    """Tek bir sensör okuması"""
+    sensor_id: int
+    value: float
+    unit: str
+    quality_score: int
+    battery_level: int
+    signal_strength: int
+    recorded_at: datetime
+    status: str
@@ -5,288 +5,575 @@ Arazi Yönetim Sistemi - Sensör Simülatörü
 Gerçekçi sensör verileri üretir
 """
 
-import random
 import math
+import sys
+from bisect import bisect_left
 from datetime import datetime, timedelta
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from itertools import accumulate
+from typing import Callable, Dict, Any, List, Optional
 
-from config import SimulatorConfig
+import numpy as np
+
+from config import SensorRange, SimulatorConfig
+from models import SensorReading
+
+# numba opsiyonel; yoksa çekirdekler saf Python olarak çalışır
+try:
+    from numba import njit, prange
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
+    prange = range
+    
+    def njit(*args, **kwargs):
+        """numba yokken fonksiyonu değiştirmeden döndür"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Tekil üretimde kullanılan hazır rastgele sayı tamponlarının boyutu
+DEVIATE_BUFFER_SIZE = 65536
+
+# Sensör durumları (toplu üretimde indeks 0..2)
+STATUS_NAMES = ('normal', 'warning', 'critical')
+
+# Toplu üretimde paralel numba çekirdeğine geçilen en az sensör sayısı
+PARALLEL_MIN_SENSORS = 1000
+
+# Senaryo kuralları (tekil ve toplu üretim ortak kullanır)
+# Bu senaryolarda temel değer normal dağılımdan gelir; diğer senaryolar tüm
+# aralıkta tekdüze dağılım kullanır
+_GAUSSIAN_SCENARIOS = frozenset({'normal', 'drought', 'rainy', 'extreme_temp'})
+# (senaryo, sensör tipi) -> ranges'e göre tekdüze dağılım sınırları; yukarıdaki
+# varsayılanı geçersiz kılar
+_SCENARIO_BASE_RANGES = {
+    ('drought', 'soil_moisture'): lambda r: (r.min, r.min + 10),
+    ('drought', 'air_temperature'): lambda r: (r.max - 5, r.max),
+    ('rainy', 'soil_moisture'): lambda r: (r.max - 10, r.max),
+    ('rainy', 'air_temperature'): lambda r: (r.min, r.min + 5),
+    ('rainy', 'rainfall'): lambda r: (5, r.max),
+    ('extreme_temp', 'air_temperature'): lambda r: (r.max - 2, r.max + 5),
+    ('extreme_temp', 'soil_moisture'): lambda r: (r.min, r.min + 15),
+}
+_QUALITY_PENALTIES = {'extreme_temp': (5, 15), 'drought': (2, 8)}
+_SIGNAL_PENALTIES = {'rainy': (5, 15), 'extreme_temp': (2, 8)}
+
+@njit(cache=True)
+def _temp_time_modifier(hour: int, min_hour: float, max_hour: float, day_span: float,
+                        evening_span: float, amplitude: float) -> float:
+    """Günlük sıcaklık döngüsünden gelen değişim (amplitude = variation / 2)"""
+    if min_hour <= hour <= max_hour:
+        # Gündüz - sıcaklık artıyor
+        progress = (hour - min_hour) / day_span
+        return math.sin(progress * math.pi) * amplitude
+    
+    # Gece - sıcaklık düşüyor
+    if hour < min_hour:
+        progress = hour / min_hour
+    else:
+        progress = (hour - max_hour) / evening_span
+    return -math.cos(progress * math.pi) * amplitude
+
+@njit(cache=True)
+def _light_time_intensity(hour: int, sunrise: float, sunset: float, noon: float,
+                          morning_span: float, afternoon_span: float, max_intensity: float) -> float:
+    """Gündüz ışık şiddeti (gece NaN)"""
+    if not sunrise <= hour <= sunset:
+        return math.nan
+    
+    if hour <= noon:
+        # Sabah - ışık artıyor
+        progress = (hour - sunrise) / morning_span
+    else:
+        # Öğleden sonra - ışık azalıyor
+        progress = 1 - (hour - noon) / afternoon_span
+    
+    return math.sin(progress * math.pi) * max_intensity
+
+@njit(parallel=True, cache=True)
+def _step_sensors(values, last, direction, draws, variation, range_min, range_max, bounds, status):
+    """Trend, rastgele değişim, sınır ve durum adımı (her sensör bağımsız, yerinde günceller)"""
+    for i in prange(values.shape[0]):
+        value = values[i]
+        trend = direction[i]
+        
+        # Trend yönünü belirle (eğer yoksa)
+        if trend == 0:
+            trend = 1 if draws[i, 0] < 0.5 else -1
+        
+        # Son değerle karşılaştır (NaN: önceki değer yok)
+        if not math.isnan(last[i]):
+            difference = value - last[i]
+            if (difference > 0 and trend > 0) or (difference < 0 and trend < 0):
+                # Trend devam ediyor - biraz daha güçlendir
+                value += trend * (0.1 + 0.2 * draws[i, 1])
+            else:
+                # Trend değişti - yeni yön belirle
+                trend = 1 if draws[i, 2] < 0.5 else -1
+        
+        # Rastgele değişim ve sınırlar
+        value += variation[i] * (2 * draws[i, 3] - 1)
+        value = min(max(value, range_min[i]), range_max[i])
+        
+        # Sensör durumu
+        if value < bounds[i, 0] or value > bounds[i, 3]:
+            status[i] = 2
+        elif value < bounds[i, 1] or value > bounds[i, 2]:
+            status[i] = 1
+        else:
+            status[i] = 0
+        
+        values[i] = value
+        direction[i] = trend
+
+def _step_sensors_numpy(values, last, direction, draws, variation, range_min, range_max, bounds, status):
+    """_step_sensors'ın NumPy karşılığı; aynı girdilerle aynı sonucu üretir"""
+    # Trend yönünü belirle (eğer yoksa)
+    new_trend = direction == 0
+    direction[new_trend] = np.where(draws[new_trend, 0] < 0.5, 1, -1)
+    
+    # Son değerle karşılaştır (NaN: önceki değer yok)
+    has_last = ~np.isnan(last)
+    difference = values - last
+    continuing = has_last & (((difference > 0) & (direction > 0)) | ((difference < 0) & (direction < 0)))
+    values[continuing] += direction[continuing] * (0.1 + 0.2 * draws[continuing, 1])
+    changed = has_last & ~continuing
+    direction[changed] = np.where(draws[changed, 2] < 0.5, 1, -1)
+    
+    # Rastgele değişim ve sınırlar
+    values += variation * (2 * draws[:, 3] - 1)
+    np.clip(values, range_min, range_max, out=values)
+    
+    # Sensör durumu
+    critical = (values < bounds[:, 0]) | (values > bounds[:, 3])
+    warning = (values < bounds[:, 1]) | (values > bounds[:, 2])
+    status[:] = np.select([critical, warning], [2, 1], 0)
+
+_SCENARIO_DESCRIPTIONS = {
+    'normal': 'Normal hava koşulları',
+    'drought': 'Kuraklık dönemi - düşük nem, yüksek sıcaklık',
+    'rainy': 'Yağışlı dönem - yüksek nem, düşük sıcaklık',
+    'extreme_temp': 'Aşırı sıcaklık - kritik değerler'
+}
+
+@lru_cache(maxsize=8)
+def _scenario_description(scenario: str) -> str:
+    """Senaryo açıklaması"""
+    return _SCENARIO_DESCRIPTIONS.get(scenario, 'Bilinmeyen senaryo')
 
 class SensorSimulator:
     """Sensör veri simülatörü"""
     
-    def __init__(self):
+    def __init__(self, seed: Optional[int] = None):
         self.current_scenario = 'normal'
-        self.last_values = {}  # Son değerleri sakla
-        self.trend_direction = {}  # Trend yönü
-        
-    def generate_sensor_data(self, sensor: Dict[str, Any]) -> Dict[str, Any]:
-        """Sensör verisi üret"""
         
-        sensor_type = sensor['type_name']
-        sensor_id = sensor['id']
+        # Sensör başına durum: sensör id -> satır eşlemesiyle yoğun diziler
+        self._sensor_index: Dict[int, int] = {}
+        self._battery = np.empty(0)  # Batarya seviyeleri
+        self._last_values = np.empty(0)  # Son değerler (NaN: henüz yok)
+        self._trend_direction = np.empty(0, dtype=np.int8)  # Trend yönü (0: henüz yok)
         
-        # Senaryo seç
-        self._select_scenario()
+        # NumPy üreteci (normal dağılım Ziggurat ile); tohum verilirse çıktı tekrarlanabilir
+        self._rng = np.random.default_rng(SimulatorConfig.RANDOM_SEED if seed is None else seed)
         
-        # Temel değer üret
-        base_value = self._generate_base_value(sensor_type)
+        # Zaman etkisi sabitleri ve türetilmiş aralıklar (çekirdeklere float olarak geçirilir)
+        temp_effects = SimulatorConfig.TIME_EFFECTS['hourly']['temperature']
+        min_hour, max_hour = float(temp_effects['min_hour']), float(temp_effects['max_hour'])
+        self._temp_effects = (min_hour, max_hour, max_hour - min_hour, 24 - max_hour,
+                              temp_effects['variation'] / 2)
+        light_effects = SimulatorConfig.TIME_EFFECTS['hourly']['light']
+        sunrise, sunset = float(light_effects['sunrise_hour']), float(light_effects['sunset_hour'])
+        noon = (sunrise + sunset) / 2
+        self._light_effects = (sunrise, sunset, noon, noon - sunrise, sunset - noon,
+                               float(light_effects['max_intensity']))
         
-        # Zaman etkilerini uygula
-        time_adjusted_value = self._apply_time_effects(sensor_type, base_value)
+        # Ay -> mevsimsel sıcaklık değişimi tablosu (indeks: ay - 1)
+        self._season_temp_by_month = [self._seasonal_temperature_modifier(month) for month in range(1, 13)]
         
-        # Trend ve korelasyon uygula
-        trend_adjusted_value = self._apply_trends(sensor_type, time_adjusted_value, sensor_id)
+        # Tick zamanı (saat/ay her sensörde yeniden hesaplanmaz)
+        self.begin_tick()
         
-        # Rastgele değişim ekle
-        final_value = self._add_random_variation(sensor_type, trend_adjusted_value)
+        # Tekil üretim için önceden çekilmiş U(0,1) ve N(0,1) tamponları
+        self._u_buf, self._u_idx = [], 0
+        self._n_buf, self._n_idx = [], 0
+        self._scenario_keys = list(SimulatorConfig.SCENARIOS.keys())
+        self._scenario_cdf = list(accumulate(SimulatorConfig.SCENARIOS.values()))
         
-        # Sınırlar içinde tut
-        final_value = self._clamp_value(sensor_type, final_value)
+        # Tip başına sınırlar; sıcak yolda config sözlüğüne tekrar tekrar bakılmaz
+        self._ranges = dict(SimulatorConfig.SENSOR_RANGES)
+        self._type_index = {name: i for i, name in enumerate(self._ranges)}
+        # Birimler intern edilir; her okuma aynı str nesnesini paylaşır
+        self._units = {name: sys.intern(r.unit) for name, r in self._ranges.items()}
         
-        # Son değeri sakla
-        self.last_values[sensor_id] = final_value
+        ranges = list(self._ranges.values())
+        self._range_min = np.array([r.min for r in ranges], dtype=float)
+        self._range_max = np.array([r.max for r in ranges], dtype=float)
+        self._range_variation = np.array([r.variation for r in ranges], dtype=float)
+        self._status_thresholds = {name: self._status_bounds_for(name, r) for name, r in self._ranges.items()}
+        self._status_bounds = np.array(list(self._status_thresholds.values()), dtype=float)
+        self._uniform_scenarios = [
+            index for index, name in enumerate(self._scenario_keys) if name not in _GAUSSIAN_SCENARIOS
+        ]
+        self._scenario_base_ranges = [
+            (self._scenario_keys.index(scenario), self._type_index[sensor_type],
+             bounds(self._ranges[sensor_type]))
+            for (scenario, sensor_type), bounds in _SCENARIO_BASE_RANGES.items()
+            if scenario in SimulatorConfig.SCENARIOS and sensor_type in self._type_index
+        ]
+        self._quality_penalty = np.array(
+            [_QUALITY_PENALTIES.get(name, (0, 0)) for name in self._scenario_keys], dtype=float
+        )
+        self._signal_penalty = np.array(
+            [_SIGNAL_PENALTIES.get(name, (0, 0)) for name in self._scenario_keys], dtype=float
+        )
         
-        # Sensör durumu hesapla
-        sensor_status = self._calculate_sensor_status(sensor_type, final_value)
+        # Tekil üretim: sensör tipine özel üreticiler (tip kontrolleri kurulumda çözülür)
+        self._scenario_index = self._scenario_keys.index(self.current_scenario)
+        self._dispatch = {name: self._build_generator(name) for name in self._ranges}
+    
+    def _next_uniform(self) -> float:
+        """Tampondan U(0,1) değeri al, bitince toplu olarak yeniden doldur"""
+        if self._u_idx >= len(self._u_buf):
+            self._u_buf = self._rng.random(DEVIATE_BUFFER_SIZE).tolist()
+            self._u_idx = 0
+        value = self._u_buf[self._u_idx]
+        self._u_idx += 1
+        return value
+    
+    def _next_normal(self) -> float:
+        """Tampondan N(0,1) değeri al, bitince toplu olarak yeniden doldur"""
+        if self._n_idx >= len(self._n_buf):
+            self._n_buf = self._rng.standard_normal(DEVIATE_BUFFER_SIZE).tolist()
+            self._n_idx = 0
+        value = self._n_buf[self._n_idx]
+        self._n_idx += 1
+        return value
+    
+    def _uniform(self, low: float, high: float) -> float:
+        """[low, high) aralığında tekdüze değer"""
+        return low + (high - low) * self._next_uniform()
+    
+    @staticmethod
+    def _status_bounds_for(sensor_type: str, ranges: SensorRange) -> tuple:
+        """Durum eşikleri: (kritik alt, uyarı alt, uyarı üst, kritik üst)"""
+        if sensor_type == 'soil_moisture':
+            # Toprak nemi: Optimal 40-70%, Warning 25-40% / 70-85%, Critical <25% / >85%
+            return (25, 40, 70, 85)
+        return (ranges.critical_min, ranges.critical_min * 1.2,
+                ranges.critical_max * 0.8, ranges.critical_max)
+    
+    def begin_tick(self, now: Optional[datetime] = None) -> datetime:
+        """Yeni üretim turunu başlat; saat, ay ve zaman damgasını bir kez belirle"""
+        now = now or datetime.now()
+        self._tick_ts = now
+        self._tick_hour = now.hour
+        self._tick_month = now.month
         
-        return {
-            'sensor_id': sensor_id,
-            'value': round(final_value, 3),
-            'unit': SimulatorConfig.SENSOR_RANGES[sensor_type]['unit'],
-            'quality_score': self._calculate_quality_score(),
-            'battery_level': self._simulate_battery_level(sensor_id),
-            'signal_strength': self._simulate_signal_strength(),
-            'recorded_at': datetime.now(),
-            'status': sensor_status
-        }
+        # Saatlik ve mevsimsel etkiler tick boyunca sabit; tek değere indir
+        self._tick_temp_modifier = (self._hourly_temperature_modifier(now.hour) +
+                                    self._season_temp_by_month[now.month - 1])
+        self._tick_light_intensity = self._daylight_intensity(now.hour)
+        return now
     
-    def _select_scenario(self):
-        """Simülasyon senaryosu seç"""
-        rand = random.random()
-        cumulative = 0
-        
-        for scenario, probability in SimulatorConfig.SCENARIOS.items():
-            cumulative += probability
-            if rand <= cumulative:
-                self.current_scenario = scenario
-                break
+    def generate_sensor_data(self, sensor: Dict[str, Any],
+                             recorded_at: Optional[datetime] = None) -> SensorReading:
+        """Sensör verisi üret (recorded_at verilmezse son begin_tick zamanı kullanılır)"""
+        if recorded_at is not None and recorded_at is not self._tick_ts:
+            self.begin_tick(recorded_at)
+        
+        return self._dispatch[sensor['type_name']](sensor['id'])
     
-    def _generate_base_value(self, sensor_type: str) -> float:
-        """Temel sensör değeri üret"""
-        ranges = SimulatorConfig.SENSOR_RANGES[sensor_type]
-        
-        if self.current_scenario == 'normal':
-            # Normal dağılım
-            mean = (ranges['min'] + ranges['max']) / 2
-            std = (ranges['max'] - ranges['min']) / 6
-            return random.gauss(mean, std)
-            
-        elif self.current_scenario == 'drought':
-            # Kuraklık - nem düşük, sıcaklık yüksek
-            if sensor_type == 'soil_moisture':
-                return random.uniform(ranges['min'], ranges['min'] + 10)
-            elif sensor_type == 'air_temperature':
-                return random.uniform(ranges['max'] - 5, ranges['max'])
-            else:
-                # Normal dağılım döndür
-                mean = (ranges['min'] + ranges['max']) / 2
-                std = (ranges['max'] - ranges['min']) / 6
-                return random.gauss(mean, std)
-                
-        elif self.current_scenario == 'rainy':
-            # Yağışlı - nem yüksek, sıcaklık düşük
-            if sensor_type == 'soil_moisture':
-                return random.uniform(ranges['max'] - 10, ranges['max'])
-            elif sensor_type == 'air_temperature':
-                return random.uniform(ranges['min'], ranges['min'] + 5)
-            elif sensor_type == 'rainfall':
-                return random.uniform(5, ranges['max'])
-            else:
-                # Normal dağılım döndür
-                mean = (ranges['min'] + ranges['max']) / 2
-                std = (ranges['max'] - ranges['min']) / 6
-                return random.gauss(mean, std)
-                
-        elif self.current_scenario == 'extreme_temp':
-            # Aşırı sıcaklık
-            if sensor_type == 'air_temperature':
-                return random.uniform(ranges['max'] - 2, ranges['max'] + 5)
-            elif sensor_type == 'soil_moisture':
-                return random.uniform(ranges['min'], ranges['min'] + 15)
-            else:
-                # Normal dağılım döndür
-                mean = (ranges['min'] + ranges['max']) / 2
-                std = (ranges['max'] - ranges['min']) / 6
-                return random.gauss(mean, std)
+    def _base_value_params(self, sensor_type: str) -> List[tuple]:
+        """Senaryo indeksine göre temel değer parametreleri: (normal dağılım mı, konum, ölçek)"""
+        ranges = self._ranges[sensor_type]
+        type_idx = self._type_index[sensor_type]
         
-        return random.uniform(ranges['min'], ranges['max'])
+        # Varsayılan: normal dağılım ya da tüm aralıkta tekdüze dağılım
+        params = [
+            (True, (ranges.min + ranges.max) / 2, (ranges.max - ranges.min) / 6)
+            if name in _GAUSSIAN_SCENARIOS else (False, ranges.min, ranges.max - ranges.min)
+            for name in self._scenario_keys
+        ]
+        for scenario, sensor_type_idx, (low, high) in self._scenario_base_ranges:
+            if sensor_type_idx == type_idx:
+                params[scenario] = (False, low, high - low)
+        return params
     
-    def _apply_time_effects(self, sensor_type: str, base_value: float) -> float:
-        """Zaman etkilerini uygula"""
-        now = datetime.now()
-        hour = now.hour
-        month = now.month
-        
-        # Saatlik etkiler
-        if sensor_type == 'air_temperature':
-            temp_effects = SimulatorConfig.TIME_EFFECTS['hourly']['temperature']
-            min_hour = temp_effects['min_hour']
-            max_hour = temp_effects['max_hour']
-            variation = temp_effects['variation']
+    def _build_generator(self, sensor_type: str) -> Callable[[int], SensorReading]:
+        """Sensör tipine özel üretici; sabitler ve tip kontrolleri kurulumda bir kez bağlanır"""
+        ranges = self._ranges[sensor_type]
+        low, high, variation = ranges.min, ranges.max, ranges.variation
+        unit = self._units[sensor_type]
+        sensor_index = self._sensor_index
+        critical_low, warning_low, warning_high, critical_high = self._status_thresholds[sensor_type]
+        base_params = self._base_value_params(sensor_type)
+        is_temperature = sensor_type == 'air_temperature'
+        is_light = sensor_type == 'light_intensity'
+        random_variations = SimulatorConfig.ENABLE_RANDOM_VARIATIONS
+        
+        def generate(sensor_id: int) -> SensorReading:
+            row = sensor_index.get(sensor_id)
+            if row is None:
+                row = self._sensor_rows((sensor_id,))[0]
             
-            # Günlük sıcaklık döngüsü
-            if min_hour <= hour <= max_hour:
-                # Gündüz - sıcaklık artıyor
-                progress = (hour - min_hour) / (max_hour - min_hour)
-                temp_modifier = math.sin(progress * math.pi) * variation / 2
-            else:
-                # Gece - sıcaklık düşüyor
-                if hour < min_hour:
-                    progress = hour / min_hour
+            # Senaryo seç
+            self._select_scenario()
+            
+            # Temel değer üret
+            gaussian, location, scale = base_params[self._scenario_index]
+            value = location + scale * (self._next_normal() if gaussian else self._next_uniform())
+            
+            # Zaman etkilerini uygula (begin_tick'te hesaplanır)
+            if is_temperature:
+                value += self._tick_temp_modifier
+            elif is_light:
+                intensity = self._tick_light_intensity
+                if intensity is not None:
+                    value = max(value, intensity)
                 else:
-                    progress = (hour - max_hour) / (24 - max_hour)
-                temp_modifier = -math.cos(progress * math.pi) * variation / 2
+                    # Gece - çok az ışık
+                    value = self._uniform(0, 100)
             
-            base_value += temp_modifier
+            # Trend uygula
+            value = self._apply_trends(value, row)
             
-        elif sensor_type == 'light_intensity':
-            light_effects = SimulatorConfig.TIME_EFFECTS['hourly']['light']
-            sunrise = light_effects['sunrise_hour']
-            sunset = light_effects['sunset_hour']
-            max_intensity = light_effects['max_intensity']
+            # Rastgele değişim ekle
+            if random_variations:
+                value += self._uniform(-variation, variation)
             
-            if sunrise <= hour <= sunset:
-                # Gündüz - ışık var
-                if hour <= (sunrise + sunset) / 2:
-                    # Sabah - ışık artıyor
-                    progress = (hour - sunrise) / ((sunrise + sunset) / 2 - sunrise)
-                else:
-                    # Öğleden sonra - ışık azalıyor
-                    progress = 1 - (hour - (sunrise + sunset) / 2) / (sunset - (sunrise + sunset) / 2)
-                
-                intensity = math.sin(progress * math.pi) * max_intensity
-                base_value = max(base_value, intensity)
+            # Sınırlar içinde tut
+            value = max(low, min(high, value))
+            
+            # Son değeri sakla
+            self._last_values[row] = value
+            
+            # Sensör durumu (dallanmasız: kritik -> 2, yalnızca uyarı -> 1, aksi halde 0)
+            critical = (value < critical_low) | (value > critical_high)
+            warning = (value < warning_low) | (value > warning_high)
+            
+            # 3 ondalık basamağa yuvarla (round() yerine tamsayı aritmetiği)
+            rounded_value = int(value * 1000 + (0.5 if value >= 0 else -0.5)) / 1000.0
+            
+            return SensorReading(
+                sensor_id=sensor_id,
+                value=rounded_value,
+                unit=unit,
+                quality_score=self._calculate_quality_score(),
+                battery_level=self._simulate_battery_level(row),
+                signal_strength=self._simulate_signal_strength(),
+                recorded_at=self._tick_ts,
+                status=STATUS_NAMES[2 * critical + (warning > critical)]
+            )
+        
+        return generate
+    
+    def generate_sensor_data_batch(self, sensors: List[Dict[str, Any]],
+                                   recorded_at: Optional[datetime] = None) -> List[SensorReading]:
+        """Birden fazla sensörün verisini NumPy ile tek seferde üret"""
+        count = len(sensors)
+        if count == 0:
+            return []
+        
+        rng = self._rng
+        now = self.begin_tick(recorded_at)
+        sensor_ids = [sensor['id'] for sensor in sensors]
+        type_idx = np.array([self._type_index[sensor['type_name']] for sensor in sensors])
+        range_min = self._range_min[type_idx]
+        range_max = self._range_max[type_idx]
+        
+        # Her sensör için senaryo seç
+        scenario_idx = np.searchsorted(self._scenario_cdf, rng.random(count))
+        np.minimum(scenario_idx, len(self._scenario_keys) - 1, out=scenario_idx)
+        
+        # Temel değer: normal dağılım, normal dağılımlı olmayan senaryolarda ve
+        # senaryoya özel durumlarda tekdüze dağılım
+        values = rng.normal((range_min + range_max) / 2, (range_max - range_min) / 6)
+        for scenario in self._uniform_scenarios:
+            mask = scenario_idx == scenario
+            if mask.any():
+                values[mask] = rng.uniform(range_min[mask], range_max[mask])
+        for scenario, sensor_type, (low, high) in self._scenario_base_ranges:
+            mask = (scenario_idx == scenario) & (type_idx == sensor_type)
+            selected = np.count_nonzero(mask)
+            if selected:
+                values[mask] = rng.uniform(low, high, selected)
+        
+        # Zaman etkileri (saat ve ay tüm tick için aynı)
+        temp_mask = type_idx == self._type_index.get('air_temperature', -1)
+        if temp_mask.any():
+            values[temp_mask] += self._tick_temp_modifier
+        
+        light_mask = type_idx == self._type_index.get('light_intensity', -1)
+        selected = np.count_nonzero(light_mask)
+        if selected:
+            intensity = self._tick_light_intensity
+            if intensity is not None:
+                np.maximum(values, intensity, out=values, where=light_mask)
             else:
-                # Gece - çok az ışık
-                base_value = random.uniform(0, 100)
+                values[light_mask] = rng.uniform(0, 100, selected)
+        
+        # Trendler
+        rows = np.array(self._sensor_rows(sensor_ids))
+        last = self._last_values[rows]
+        direction = self._trend_direction[rows].astype(np.int64)
+        bounds = self._status_bounds[type_idx]
+        if SimulatorConfig.ENABLE_RANDOM_VARIATIONS:
+            variation = self._range_variation[type_idx]
+        else:
+            variation = np.zeros(count)
+        
+        # Büyük kurulumlarda sensör adımı paralel çekirdekte; iki uygulama da aynı,
+        # tohumlanabilir üreteçten önceden çekilmiş rastgele sayıları kullanır
+        if _HAVE_NUMBA and count >= PARALLEL_MIN_SENSORS:
+            step = _step_sensors
+        else:
+            step = _step_sensors_numpy
+        status_idx = np.empty(count, dtype=np.int64)
+        step(values, last, direction, rng.random((count, 4)), variation,
+             range_min, range_max, bounds, status_idx)
+        
+        self._last_values[rows] = values
+        self._trend_direction[rows] = direction
+        
+        # Kalite, batarya ve sinyal
+        penalty = self._quality_penalty[scenario_idx]
+        quality = rng.uniform(95, 100, count) - rng.uniform(penalty[:, 0], penalty[:, 1])
+        quality = np.clip(quality.astype(int), 50, 100)
+        
+        battery = np.maximum(self._battery[rows] - rng.uniform(0.05, 0.15, count), 10)
+        self._battery[rows] = battery
+        
+        penalty = self._signal_penalty[scenario_idx]
+        rssi = rng.uniform(-80, -40, count) - rng.uniform(penalty[:, 0], penalty[:, 1])
+        rssi = np.clip(rssi, -120, -30).astype(int)
+        
+        self.current_scenario = self._scenario_keys[scenario_idx[-1]]
         
-        # Mevsimsel etkiler
+        # 3 ondalık basamağa yuvarla (tekil yolla aynı kural: yarımlar sıfırdan uzağa)
+        values = np.trunc(values * 1000 + np.where(values >= 0, 0.5, -0.5)) / 1000.0
+        
+        units = self._units
+        return [
+            SensorReading(
+                sensor_id, value, units[sensor['type_name']],
+                quality_score, battery_level, signal_strength, now, STATUS_NAMES[status]
+            )
+            for sensor, sensor_id, value, quality_score, battery_level, signal_strength, status in zip(
+                sensors, sensor_ids, values.tolist(), quality.tolist(),
+                battery.astype(int).tolist(), rssi.tolist(), status_idx.tolist()
+            )
+        ]
+    
+    def _select_scenario(self):
+        """Simülasyon senaryosu seç"""
+        index = bisect_left(self._scenario_cdf, self._next_uniform())
+        if index < len(self._scenario_keys):
+            self._scenario_index = index
+            self.current_scenario = self._scenario_keys[index]
+    
+    def _hourly_temperature_modifier(self, hour: int) -> float:
+        """Günlük sıcaklık döngüsünden gelen değişim"""
+        return _temp_time_modifier(hour, *self._temp_effects)
+    
+    def _daylight_intensity(self, hour: int) -> Optional[float]:
+        """Gündüz ışık şiddeti (gece None)"""
+        intensity = _light_time_intensity(hour, *self._light_effects)
+        return None if math.isnan(intensity) else intensity
+    
+    def _seasonal_temperature_modifier(self, month: int) -> float:
+        """Mevsime göre sıcaklık değişimi"""
         for season, config in SimulatorConfig.TIME_EFFECTS['seasonal'].items():
             if month in config['months']:
-                if sensor_type == 'air_temperature':
-                    base_value += config['temp_modifier']
-                break
-        
-        return base_value
+                return config['temp_modifier']
+        return 0
     
-    def _apply_trends(self, sensor_type: str, value: float, sensor_id: int) -> float:
-        """Trend ve korelasyon uygula"""
+    def _apply_trends(self, value: float, row: int) -> float:
+        """Trend uygula"""
         
         # Trend yönünü belirle (eğer yoksa)
-        if sensor_id not in self.trend_direction:
-            self.trend_direction[sensor_id] = random.choice([-1, 1])
+        trend = int(self._trend_direction[row])
+        if trend == 0:
+            trend = 1 - 2 * (self._next_uniform() < 0.5)
         
         # Son değerle karşılaştır
-        if sensor_id in self.last_values:
-            last_value = self.last_values[sensor_id]
+        last_value = self._last_values.item(row)
+        if not math.isnan(last_value):
             difference = value - last_value
             
             # Trend devam ediyor mu kontrol et
-            if (difference > 0 and self.trend_direction[sensor_id] > 0) or \
-               (difference < 0 and self.trend_direction[sensor_id] < 0):
+            if (difference > 0 and trend > 0) or (difference < 0 and trend < 0):
                 # Trend devam ediyor - biraz daha güçlendir
-                trend_strength = random.uniform(0.1, 0.3)
-                value += self.trend_direction[sensor_id] * trend_strength
+                trend_strength = self._uniform(0.1, 0.3)
+                value += trend * trend_strength
             else:
                 # Trend değişti - yeni yön belirle
-                self.trend_direction[sensor_id] = random.choice([-1, 1])
-        
-        # Sensörler arası korelasyon
-        if sensor_type == 'air_temperature' and 'soil_moisture' in self.last_values:
-            # Sıcaklık artarsa nem azalır
-            temp_change = value - (self.last_values.get(sensor_id, value))
-            if abs(temp_change) > 2:
-                # Sıcaklık değişimi büyükse nem etkilenir
-                pass  # Bu kısım daha karmaşık korelasyon için
+                trend = 1 - 2 * (self._next_uniform() < 0.5)
         
+        self._trend_direction[row] = trend
         return value
     
-    def _add_random_variation(self, sensor_type: str, value: float) -> float:
-        """Rastgele değişim ekle"""
-        if not SimulatorConfig.ENABLE_RANDOM_VARIATIONS:
-            return value
-        
-        variation = SimulatorConfig.SENSOR_RANGES[sensor_type]['variation']
-        random_change = random.uniform(-variation, variation)
-        
-        return value + random_change
-    
-    def _clamp_value(self, sensor_type: str, value: float) -> float:
-        """Değeri sınırlar içinde tut"""
-        ranges = SimulatorConfig.SENSOR_RANGES[sensor_type]
-        return max(ranges['min'], min(ranges['max'], value))
-    
-    def _calculate_sensor_status(self, sensor_type: str, value: float) -> str:
-        """Sensör durumunu hesapla"""
-        ranges = SimulatorConfig.SENSOR_RANGES[sensor_type]
-        
-        if sensor_type == 'soil_moisture':
-            # Toprak nemi için özel mantık: Optimal: 40-70%, Warning: 25-40% veya 70-85%, Critical: <25% veya >85%
-            if value < 25 or value > 85:
-                return 'critical'
-            elif (value >= 25 and value < 40) or (value > 70 and value <= 85):
-                return 'warning'
-            else:
-                return 'normal'
-        else:
-            # Diğer sensörler için genel mantık
-            if value < ranges['critical_min'] or value > ranges['critical_max']:
-                return 'critical'
-            elif value < (ranges['critical_min'] * 1.2) or value > (ranges['critical_max'] * 0.8):
-                return 'warning'
-            else:
-                return 'normal'
-    
     def _calculate_quality_score(self) -> int:
         """Veri kalitesi skoru hesapla"""
         # %95-100 arası normal kalite
-        base_score = random.uniform(95, 100)
+        base_score = self._uniform(95, 100)
         
         # Senaryoya göre kalite düşür
         if self.current_scenario == 'extreme_temp':
-            base_score -= random.uniform(5, 15)
+            base_score -= self._uniform(5, 15)
         elif self.current_scenario == 'drought':
-            base_score -= random.uniform(2, 8)
+            base_score -= self._uniform(2, 8)
         
         return max(50, min(100, int(base_score)))
     
-    def _simulate_battery_level(self, sensor_id: int) -> int:
+    def _simulate_battery_level(self, row: int) -> int:
         """Batarya seviyesi simüle et"""
         # Başlangıçta %100, zamanla azalır
-        if sensor_id not in self.last_values:
+        if math.isnan(self._last_values.item(row)):
             return 100
         
         # Her veri gönderiminde %0.1 azalır
-        current_battery = getattr(self, f'_battery_{sensor_id}', 100)
-        current_battery -= random.uniform(0.05, 0.15)
+        current_battery = self._battery.item(row) - self._uniform(0.05, 0.15)
         
         # Minimum %10'da kalır
         current_battery = max(10, current_battery)
-        setattr(self, f'_battery_{sensor_id}', current_battery)
+        self._battery[row] = current_battery
         
         return int(current_battery)
     
+    def _sensor_rows(self, sensor_ids) -> List[int]:
+        """Sensörlerin durum dizilerindeki satırları (yeni sensörler için satır açılır)"""
+        index = self._sensor_index
+        for sensor_id in sensor_ids:
+            if sensor_id not in index:
+                index[sensor_id] = len(index)
+        
+        # Diziler dolduğunda kapasiteyi ikiye katla
+        if len(index) > len(self._battery):
+            capacity = max(len(index), 2 * len(self._battery))
+            self._battery = self._grow(self._battery, capacity, 100.0)
+            self._last_values = self._grow(self._last_values, capacity, np.nan)
+            self._trend_direction = self._grow(self._trend_direction, capacity, 0)
+        
+        return [index[sensor_id] for sensor_id in sensor_ids]
+    
+    @staticmethod
+    def _grow(array: np.ndarray, capacity: int, fill) -> np.ndarray:
+        """Diziyi verilen kapasiteye büyüt, yeni satırları fill ile doldur"""
+        grown = np.full(capacity, fill, dtype=array.dtype)
+        grown[:len(array)] = array
+        return grown
+    
     def _simulate_signal_strength(self) -> int:
         """Sinyal gücü simüle et"""
         # RSSI değeri: -120 ile -30 arası
-        base_rssi = random.uniform(-80, -40)
+        base_rssi = self._uniform(-80, -40)
         
         # Hava durumuna göre değişim
         if self.current_scenario == 'rainy':
-            base_rssi -= random.uniform(5, 15)
+            base_rssi -= self._uniform(5, 15)
         elif self.current_scenario == 'extreme_temp':
-            base_rssi -= random.uniform(2, 8)
+            base_rssi -= self._uniform(2, 8)
         
         return int(max(-120, min(-30, base_rssi)))
     
@@ -300,10 +587,4 @@ class SensorSimulator:
     
     def _get_scenario_description(self) -> str:
         """Senaryo açıklaması"""
-        descriptions = {
-            'normal': 'Normal hava koşulları',
-            'drought': 'Kuraklık dönemi - düşük nem, yüksek sıcaklık',
-            'rainy': 'Yağışlı dönem - yüksek nem, düşük sıcaklık',
-            'extreme_temp': 'Aşırı sıcaklık - kritik değerler'
-        }
-        return descriptions.get(self.current_scenario, 'Bilinmeyen senaryo') 
\ No newline at end of file
+        return _scenario_description(self.current_scenario) 
\ No newline at end of file
@@ -46,12 +46,98 @@ def test_sensor_simulator():
         simulator = SensorSimulator()
         sensor_data = simulator.generate_sensor_data(test_sensor)
         
-        print(f"✅ Sensör verisi üretildi: {sensor_data['value']} {sensor_data['unit']}")
+        print(f"✅ Sensör verisi üretildi: {sensor_data.value} {sensor_data.unit}")
         return True
     except Exception as e:
         print(f"❌ Sensör simülatör hatası: {e}")
         return False
 
+def test_sensor_simulator_batch():
+    """Toplu sensör simülatör testi (hata durumunda AssertionError fırlatır)"""
+    from datetime import datetime
+    from config import SimulatorConfig
+    from sensor_simulator import STATUS_NAMES, SensorSimulator
+    
+    # Her tipten bir test sensörü
+    test_sensors = [
+        {'id': sensor_id, 'type_name': type_name}
+        for sensor_id, type_name in enumerate(SimulatorConfig.SENSOR_RANGES, start=1)
+    ]
+    
+    simulator = SensorSimulator(seed=42)
+    for _ in range(50):
+        sensor_data_list = simulator.generate_sensor_data_batch(test_sensors)
+        
+        assert [d.sensor_id for d in sensor_data_list] == [sensor['id'] for sensor in test_sensors]
+        for sensor, sensor_data in zip(test_sensors, sensor_data_list):
+            ranges = SimulatorConfig.SENSOR_RANGES[sensor['type_name']]
+            assert ranges.min <= sensor_data.value <= ranges.max, (sensor, sensor_data)
+            assert sensor_data.unit == ranges.unit
+            assert sensor_data.status in STATUS_NAMES
+            assert 50 <= sensor_data.quality_score <= 100
+            assert 10 <= sensor_data.battery_level <= 100
+            assert -120 <= sensor_data.signal_strength <= -30
+    
+    # Aynı tohum aynı çıktıyı üretmeli
+    recorded_at = datetime(2024, 6, 1, 12, 0)
+    first = SensorSimulator(seed=7).generate_sensor_data_batch(test_sensors, recorded_at)
+    second = SensorSimulator(seed=7).generate_sensor_data_batch(test_sensors, recorded_at)
+    assert first == second
+    
+    for sensor_data in sensor_data_list:
+        print(f"✅ Toplu sensör verisi üretildi: {sensor_data.value} {sensor_data.unit}")
+
+def test_batch_step_kernel():
+    """Paralel çekirdek ile NumPy sensör adımı aynı sonucu vermeli (hata durumunda AssertionError)"""
+    from datetime import datetime
+    import numpy as np
+    import sensor_simulator
+    from config import SimulatorConfig
+    
+    # Aynı girdilerle iki uygulamayı doğrudan karşılaştır
+    rng = np.random.default_rng(3)
+    count = 2000
+    simulator = sensor_simulator.SensorSimulator(seed=3)
+    type_idx = rng.integers(0, len(SimulatorConfig.SENSOR_RANGES), count)
+    range_min = simulator._range_min[type_idx]
+    range_max = simulator._range_max[type_idx]
+    values = rng.uniform(range_min - 5, range_max + 5)
+    last = np.where(rng.random(count) < 0.2, np.nan, rng.uniform(range_min, range_max))
+    direction = rng.integers(-1, 2, count)
+    draws = rng.random((count, 4))
+    
+    results = []
+    for step in (sensor_simulator._step_sensors, sensor_simulator._step_sensors_numpy):
+        step_values, step_direction = values.copy(), direction.copy()
+        status = np.empty(count, dtype=np.int64)
+        step(step_values, last, step_direction, draws, simulator._range_variation[type_idx],
+             range_min, range_max, simulator._status_bounds[type_idx], status)
+        results.append((step_values, step_direction, status))
+    
+    (kernel_values, kernel_direction, kernel_status), (numpy_values, numpy_direction, numpy_status) = results
+    assert np.array_equal(kernel_values, numpy_values)
+    assert np.array_equal(kernel_direction, numpy_direction)
+    assert np.array_equal(kernel_status, numpy_status)
+    
+    # Eşiği değiştirerek toplu üretimi iki yoldan da çalıştır; aynı tohumla çıktı aynı olmalı
+    test_sensors = [
+        {'id': sensor_id, 'type_name': type_name}
+        for sensor_id, type_name in enumerate(SimulatorConfig.SENSOR_RANGES, start=1)
+    ]
+    recorded_at = datetime(2024, 6, 1, 12, 0)
+    original_threshold = sensor_simulator.PARALLEL_MIN_SENSORS
+    outputs = []
+    try:
+        for threshold in (1, len(test_sensors) + 1):
+            sensor_simulator.PARALLEL_MIN_SENSORS = threshold
+            simulator = sensor_simulator.SensorSimulator(seed=11)
+            outputs.append([simulator.generate_sensor_data_batch(test_sensors, recorded_at) for _ in range(20)])
+    finally:
+        sensor_simulator.PARALLEL_MIN_SENSORS = original_threshold
+    assert outputs[0] == outputs[1]
+    
+    print("✅ Paralel çekirdek ve NumPy sensör adımı aynı sonucu verdi")
+
 def test_database_connection():
     """Veritabanı bağlantı testi"""
     try:
@@ -94,6 +180,12 @@ def main():
     if not test_sensor_simulator():
         return
     
+    # Toplu sensör simülatör testi
+    test_sensor_simulator_batch()
+    
+    # Paralel çekirdek / NumPy tutarlılık testi
+    test_batch_step_kernel()
+    
     # Veritabanı testi
     if not test_database_connection():
         return